@@ -42,6 +42,9 @@ class Config:
     MAX_RETRIES = 3
     RETRY_BACKOFF = 1.0  # seconds
 
+    # Number of bitstream downloads kept in flight concurrently
+    DOWNLOAD_CONCURRENCY = int(os.getenv('DOWNLOAD_CONCURRENCY', '8'))
+
     # File Settings
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
     ALLOWED_MIME_TYPE = 'application/pdf'
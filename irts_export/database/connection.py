@@ -4,12 +4,13 @@ Prevents SQL injection by using prepared statements
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterator, Optional
 from contextlib import contextmanager
 
 import pymysql
 from pymysql.connections import Connection
-from pymysql.cursors import DictCursor
+from pymysql.cursors import Cursor, DictCursor, SSCursor, SSDictCursor
 
 from ..config import Config
 
@@ -26,6 +27,9 @@ class DatabaseConnection:
     Secure database connection manager with parameterized queries
     """
 
+    # Maximum entries in the per-handle lookup cache
+    CACHE_MAX_ENTRIES = 8192
+
     def __init__(
         self,
         host: str = "",
@@ -52,6 +56,14 @@ class DatabaseConnection:
 
         self.connection: Optional[Connection] = None
 
+        # Server-side prepared statements active on the current
+        # connection: name -> SQL text
+        self._prepared: Dict[str, str] = {}
+
+        # Bounded LRU cache for the hot per-handle lookups; a cache hit
+        # replaces a database round-trip with a dict access
+        self._lru_cache: OrderedDict = OrderedDict()
+
     def connect(self):
         """Establish database connection"""
         try:
@@ -66,20 +78,70 @@ class DatabaseConnection:
                 cursorclass=DictCursor,
             )
             logger.info(f"Connected to database: {self.database} at {self.host}:{self.port}")
+            self._prepared.clear()
         except pymysql.Error as e:
             raise DatabaseError(f"Failed to connect to database: {e}") from e
 
     def close(self):
         """Close database connection"""
         if self.connection:
+            # Best-effort cleanup of server-side prepared statements
+            # (they die with the connection anyway)
+            for name in list(self._prepared):
+                try:
+                    with self.get_cursor() as cursor:
+                        cursor.execute(f"DEALLOCATE PREPARE {name}")
+                except Exception:
+                    pass
+            self._prepared.clear()
+
             self.connection.close()
             logger.info("Database connection closed")
 
+        # Cached results may be stale by the next connection
+        self._lru_cache.clear()
+
+    def _cache_get(self, key: tuple) -> Optional[list]:
+        """
+        Look up a cached result and mark it most-recently-used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        try:
+            value = self._lru_cache[key]
+        except KeyError:
+            return None
+
+        self._lru_cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: tuple, value: list):
+        """
+        Store a result, evicting the least-recently-used entry if full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._lru_cache[key] = value
+        self._lru_cache.move_to_end(key)
+
+        if len(self._lru_cache) > self.CACHE_MAX_ENTRIES:
+            self._lru_cache.popitem(last=False)
+
     @contextmanager
-    def get_cursor(self):
+    def get_cursor(self, cursor_class=None):
         """
         Context manager for database cursor
 
+        Args:
+            cursor_class: Optional cursor class (defaults to the
+                connection's DictCursor)
+
         Yields:
             Database cursor
         """
@@ -88,7 +150,7 @@ class DatabaseConnection:
 
         assert self.connection is not None, "Connection should be established"
 
-        cursor = self.connection.cursor()
+        cursor = self.connection.cursor(cursor_class)
         try:
             yield cursor
             self.connection.commit()
@@ -126,137 +188,297 @@ class DatabaseConnection:
             logger.debug(f"Query returned {len(results)} rows")
             return results  # type: ignore[return-value]
 
+    def execute_prepared(
+        self,
+        name: str,
+        query: str,
+        params: tuple,
+        flat: bool = False,
+    ) -> List[Any]:
+        """
+        Execute a query through a server-side prepared statement
+
+        The statement is PREPAREd once per connection and re-EXECUTEd on
+        subsequent calls, so MySQL skips the parse/plan step for queries
+        that run thousands of times with different parameters. The SQL
+        text is bound as data (so no %% escaping) and all parameters go
+        through session variables - still injection safe.
+
+        Args:
+            name: Statement name (trusted internal identifier)
+            query: SQL query with ? placeholders
+            params: Tuple of parameters to bind
+            flat: If True, use a tuple cursor and return only the
+                first column of each row
+
+        Returns:
+            List of result rows as dictionaries, or of first-column
+            values when flat is True
+        """
+        # Names come from internal call sites only, but keep the
+        # invariant explicit since the name is interpolated into SQL
+        if not name.isidentifier():
+            raise ValueError(f"Invalid prepared statement name: {name}")
+
+        with self.get_cursor(Cursor if flat else None) as cursor:
+            if self._prepared.get(name) != query:
+                cursor.execute(f"PREPARE {name} FROM %s", (query,))
+                self._prepared[name] = query
+
+            using = ''
+            if params:
+                variables = [f'@{name}_{i}' for i in range(len(params))]
+                assignments = ', '.join(f'{var} = %s' for var in variables)
+                cursor.execute(f"SET {assignments}", params)
+                using = ' USING ' + ', '.join(variables)
+
+            cursor.execute(f"EXECUTE {name}{using}")
+            results = cursor.fetchall()
+
+        if flat:
+            return [row[0] for row in results]
+        return results  # type: ignore[return-value]
+
+    def execute_query_stream(
+        self,
+        query: str,
+        params: Optional[tuple] = None,
+        flat: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Execute a SELECT query and stream rows with an unbuffered cursor
+
+        Unlike execute_query, the result set is not materialized in
+        memory: rows are fetched from the server one at a time over a
+        dedicated connection, so the main connection stays free for
+        other queries while the stream is consumed.
+
+        Args:
+            query: SQL query with %s placeholders
+            params: Tuple of parameters to bind to query
+            flat: If True, use a tuple cursor and yield only the first
+                column of each row
+
+        Yields:
+            Result rows as dictionaries, or first-column values when
+            flat is True
+        """
+        try:
+            connection = pymysql.connect(
+                host=self.host,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                port=self.port,
+                charset='utf8mb4',
+                cursorclass=SSCursor if flat else SSDictCursor,
+            )
+        except pymysql.Error as e:
+            raise DatabaseError(f"Failed to connect to database: {e}") from e
+
+        try:
+            cursor = connection.cursor()
+            try:
+                logger.debug(f"Executing streaming query: {query[:100]}...")
+                cursor.execute(query, params or ())
+                if flat:
+                    for row in cursor:
+                        yield row[0]
+                else:
+                    yield from cursor
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
     def get_handles_for_export(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-    ) -> List[str]:
+        today: Optional[str] = None,
+    ) -> Iterator[str]:
         """
-        Get list of handles eligible for SDAIA export
+        Get handles eligible for SDAIA export
+
+        Handles are streamed from the server with an unbuffered cursor
+        rather than buffered into one list, so callers can start work
+        on the first handle before the full result set has arrived.
+        When today is given, embargoed records are excluded by the
+        database itself, so they never cross the socket.
 
         Args:
             start_date: Optional start date filter (YYYY-MM-DD format) - inclusive
             end_date: Optional end date filter (YYYY-MM-DD format) - inclusive
+            today: Optional current date (YYYY-MM-DD format); records
+                with an embargo date on or after it are excluded
 
-        Returns:
-            List of handle strings
+        Yields:
+            Handle strings
 
         Note: Uses parameterized queries to prevent SQL injection
         """
-        # Base query with parameterized community handles
+        # Self-joins over aliased metadata instances instead of nested
+        # correlated subqueries: the planner can use index-nested-loop
+        # joins rather than re-probing a dependent subquery per row, and
+        # the slow NOT IN (...) anti-join becomes LEFT JOIN ... IS NULL
         query = """
-            SELECT DISTINCT(`idInSource`) FROM `metadata`
-            WHERE `source` = 'repository'
-            AND `field` = 'dc.type'
-            AND `value` IN ('Article','Book','Book Chapter','Conference Paper','Dissertation','Patent','Preprint','Protocol','Report','Technical Report', 'Thesis')
-            AND `idInSource` IN (
-                SELECT `idInSource` FROM `metadata`
-                WHERE `source` = 'repository'
-                AND `field` = 'dspace.community.handle'
-                AND `value` IN (%s, %s)
-                AND `deleted` IS NULL
-            )
-            AND `deleted` IS NULL
+            SELECT DISTINCT m1.`idInSource` FROM `metadata` m1
+            INNER JOIN `metadata` m2
+                ON m2.`idInSource` = m1.`idInSource`
+                AND m2.`source` = 'repository'
+                AND m2.`field` = 'dspace.community.handle'
+                AND m2.`value` IN (%s, %s)
+                AND m2.`deleted` IS NULL
         """
 
         params = [Config.KAUST_RESEARCH_HANDLE, Config.KAUST_ETD_HANDLE]
 
-        # Add date filter if provided (using parameterized query)
+        # Date filters apply to the bitstream rows of each record
         if start_date or end_date:
             query += """
-                AND `idInSource` IN (
-                    SELECT `idInSource` FROM `metadata`
-                    WHERE `source` = 'repository'
-                    AND `field` = 'dspace.bitstream.uuid'
+            INNER JOIN `metadata` m3
+                ON m3.`idInSource` = m1.`idInSource`
+                AND m3.`source` = 'repository'
+                AND m3.`field` = 'dspace.bitstream.uuid'
+                AND m3.`deleted` IS NULL
             """
 
-            if start_date and end_date:
-                # Both dates: filter for range (exclude records added before start)
-                query += """
-                    AND value NOT IN (
-                        SELECT `value` FROM `metadata`
-                        WHERE `source` = 'repository'
-                        AND `field` = 'dspace.bitstream.uuid'
-                        AND `added` < %s
-                    )
-                    AND `added` >= %s
-                    AND `added` <= %s
-                """
-                params.extend([start_date, start_date, end_date])
-            elif start_date:
-                # Only start date: records added on or after start
-                query += """
-                    AND value NOT IN (
-                        SELECT `value` FROM `metadata`
-                        WHERE `source` = 'repository'
-                        AND `field` = 'dspace.bitstream.uuid'
-                        AND `added` < %s
-                    )
-                    AND `added` >= %s
-                """
-                params.extend([start_date, start_date])
-            elif end_date:
-                # Only end date: records added on or before end
-                query += """
-                    AND `added` <= %s
-                """
-                params.append(end_date)
+        if start_date:
+            # Anti-join: exclude bitstreams that already existed before
+            # the start date (replaces the old NOT IN subquery)
+            query += """
+            LEFT JOIN `metadata` m4
+                ON m4.`value` = m3.`value`
+                AND m4.`source` = 'repository'
+                AND m4.`field` = 'dspace.bitstream.uuid'
+                AND m4.`added` < %s
+            """
+            params.append(start_date)
 
+        if today:
+            # Embargo anti-join: a record with an embargo date still in
+            # the future has a matching m5 row and is filtered out by
+            # the IS NULL test below, replacing the separate
+            # get_embargoed_handles round-trip and Python set difference
             query += """
-                    AND `deleted` IS NULL
-                )
+            LEFT JOIN `metadata` m5
+                ON m5.`idInSource` = m1.`idInSource`
+                AND m5.`source` = 'repository'
+                AND m5.`field` = 'dc.rights.embargodate'
+                AND m5.`value` >= %s
+                AND m5.`deleted` IS NULL
             """
+            params.append(today)
 
-        results = self.execute_query(query, tuple(params))
-        return [row['idInSource'] for row in results]
+        query += """
+            WHERE m1.`source` = 'repository'
+            AND m1.`field` = 'dc.type'
+            AND m1.`value` IN ('Article','Book','Book Chapter','Conference Paper','Dissertation','Patent','Preprint','Protocol','Report','Technical Report', 'Thesis')
+            AND m1.`deleted` IS NULL
+        """
 
-    def get_embargoed_handles(self, today: str) -> List[str]:
+        if start_date:
+            query += """
+            AND m3.`added` >= %s
+            AND m4.`rowID` IS NULL
+            """
+            params.append(start_date)
+
+        if end_date:
+            query += """
+            AND m3.`added` <= %s
+            """
+            params.append(end_date)
+
+        if today:
+            query += """
+            AND m5.`rowID` IS NULL
+            """
+
+        yield from self.execute_query_stream(query, tuple(params), flat=True)
+
+    def get_all_metadata(
+        self,
+        handle: str,
+        fields: List[str],
+    ) -> Dict[str, List[str]]:
         """
-        Get list of handles with active embargoes
+        Get all requested metadata fields for one handle in one query
+
+        Replaces one round-trip per field with a single IN (...) query
+        grouped by field in Python.
 
         Args:
-            today: Current date in YYYY-MM-DD format
+            handle: DSpace handle
+            fields: Metadata field names to fetch
 
         Returns:
-            List of embargoed handle strings
+            Dictionary mapping field name to its list of values
         """
-        query = """
-            SELECT idInSource FROM metadata
+        if not fields:
+            return {}
+
+        field_marks = ', '.join(['%s'] * len(fields))
+
+        query = f"""
+            SELECT `field`, `value` FROM `metadata`
             WHERE `source` = 'repository'
-            AND `field` = 'dc.rights.embargodate'
-            AND `value` >= %s
+            AND `idInSource` = %s
+            AND `field` IN ({field_marks})
             AND `deleted` IS NULL
+            ORDER BY `field`, `rowID`
         """
 
-        results = self.execute_query(query, (today,))
-        return [row['idInSource'] for row in results]
+        results = self.execute_query(query, (handle, *fields))
+
+        grouped: Dict[str, List[str]] = {}
+        for row in results:
+            grouped.setdefault(row['field'], []).append(row['value'])
+
+        return grouped
 
-    def get_metadata_values(
+    def get_metadata_bulk(
         self,
-        handle: str,
-        field: str,
-    ) -> List[str]:
+        handles: List[str],
+        fields: List[str],
+    ) -> Dict[str, Dict[str, List[str]]]:
         """
-        Get metadata values for a specific handle and field
+        Get metadata values for many handles and fields in one round-trip
+
+        Replaces one query per handle per field (classic N+1) with a
+        single batched IN (...) query; callers should chunk very large
+        handle lists to keep the parameter list bounded.
 
         Args:
-            handle: DSpace handle
-            field: Metadata field name
+            handles: DSpace handles to fetch
+            fields: Metadata field names to fetch
 
         Returns:
-            List of metadata values
+            Nested dictionary: {handle: {field: [values]}}
         """
-        query = """
-            SELECT `value` FROM `metadata`
+        if not handles or not fields:
+            return {}
+
+        handle_marks = ', '.join(['%s'] * len(handles))
+        field_marks = ', '.join(['%s'] * len(fields))
+
+        query = f"""
+            SELECT `idInSource`, `field`, `value` FROM `metadata`
             WHERE `source` = 'repository'
-            AND `idInSource` = %s
-            AND `field` = %s
+            AND `idInSource` IN ({handle_marks})
+            AND `field` IN ({field_marks})
             AND `deleted` IS NULL
             ORDER BY `rowID`
         """
 
-        results = self.execute_query(query, (handle, field))
-        return [row['value'] for row in results]
+        results = self.execute_query(query, tuple(handles) + tuple(fields))
+
+        bulk: Dict[str, Dict[str, List[str]]] = {}
+        for row in results:
+            by_field = bulk.setdefault(row['idInSource'], {})
+            by_field.setdefault(row['field'], []).append(row['value'])
+
+        return bulk
 
     def get_bitstream_uuids(self, handle: str) -> List[str]:
         """
@@ -268,10 +490,17 @@ class DatabaseConnection:
         Returns:
             List of bitstream UUID strings
         """
+        cache_key = ('uuids', handle)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # The statement text is bound as data by execute_prepared, so
+        # the LIKE wildcard is a single % (no doubling needed)
         query = """
             SELECT value FROM `metadata`
             WHERE `source` = 'repository'
-            AND `idInSource` = %s
+            AND `idInSource` = ?
             AND `field` = 'dspace.bitstream.uuid'
             AND deleted IS NULL
             AND parentRowID IN (
@@ -282,16 +511,78 @@ class DatabaseConnection:
                 AND `deleted` IS NULL
             )
             AND rowID IN (
+                SELECT parentRowID FROM metadata
+                WHERE `source` = 'repository'
+                AND `field` = 'dspace.bitstream.name'
+                AND value LIKE '%.pdf'
+                AND LENGTH(value) < 256
+                AND `deleted` IS NULL
+            )
+        """
+
+        uuids = self.execute_prepared(
+            'stmt_bitstream_uuids', query, (handle,), flat=True,
+        )
+        self._cache_put(cache_key, uuids)
+        return uuids
+
+    def get_bitstream_uuids_bulk(
+        self,
+        handles: List[str],
+    ) -> Dict[str, List[str]]:
+        """
+        Get PDF bitstream UUIDs for many handles in one round-trip
+
+        Same filters as get_bitstream_uuids (ORIGINAL bundle, .pdf
+        name), batched with an IN (...) list and grouped by handle in
+        Python; callers should chunk very large handle lists to keep
+        the parameter list bounded.
+
+        Args:
+            handles: DSpace handles to fetch
+
+        Returns:
+            Dictionary mapping handle to its list of bitstream UUIDs
+            (handles without matching bitstreams are absent)
+        """
+        if not handles:
+            return {}
+
+        handle_marks = ', '.join(['%s'] * len(handles))
+
+        # Literal % in the LIKE pattern is doubled because this query
+        # goes through the client-side %s formatter
+        query = f"""
+            SELECT `idInSource`, `value` FROM `metadata`
+            WHERE `source` = 'repository'
+            AND `idInSource` IN ({handle_marks})
+            AND `field` = 'dspace.bitstream.uuid'
+            AND `deleted` IS NULL
+            AND `parentRowID` IN (
+                SELECT rowID FROM metadata
+                WHERE `source` = 'repository'
+                AND `field` = 'dspace.bundle.name'
+                AND value = 'ORIGINAL'
+                AND `deleted` IS NULL
+            )
+            AND `rowID` IN (
                 SELECT parentRowID FROM metadata
                 WHERE `source` = 'repository'
                 AND `field` = 'dspace.bitstream.name'
                 AND value LIKE '%%.pdf'
+                AND LENGTH(value) < 256
                 AND `deleted` IS NULL
             )
+            ORDER BY `rowID`
         """
 
-        results = self.execute_query(query, (handle,))
-        return [row['value'] for row in results]
+        results = self.execute_query(query, tuple(handles))
+
+        grouped: Dict[str, List[str]] = {}
+        for row in results:
+            grouped.setdefault(row['idInSource'], []).append(row['value'])
+
+        return grouped
 
     def __enter__(self):
         """Context manager entry"""
@@ -24,7 +24,11 @@ class NotFoundError(DSpaceAPIError):
 
 class RateLimitError(DSpaceAPIError):
     """Raised when API rate limit is exceeded (429)"""
-    pass
+
+    def __init__(self, message: str, status_code: int = None, response_body: str = None,
+                 retry_after: str = None):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=status_code, response_body=response_body)
 
 
 class ServerError(DSpaceAPIError):
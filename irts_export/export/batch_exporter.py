@@ -5,11 +5,17 @@ Implements incremental CSV writing for crash recovery and memory efficiency
 
 import csv
 import logging
+import mmap
+import os
 import re
+import threading
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Set, Dict, Any
+from typing import Optional, Set, Dict, Any, TextIO
 
 from tqdm import tqdm
 
@@ -19,6 +25,7 @@ from ..validators import (
     validate_handle,
     sanitize_filename,
     validate_safe_path,
+    FileSizeLimitError,
 )
 from ..database import DatabaseConnection
 from ..dspace import DSpaceClient
@@ -26,6 +33,10 @@ from ..dspace.exceptions import DSpaceAPIError
 
 logger = logging.getLogger(__name__)
 
+# Whitespace runs collapsed in metadata values; compiled once since the
+# substitution runs once per field per record
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class BatchExporter:
     """
@@ -45,6 +56,32 @@ class BatchExporter:
 
     CSV_FIELDNAMES = ['Handle', 'File'] + list(WORK_FIELDS.keys())
 
+    # Field names in query order, built once instead of per call site
+    WORK_FIELD_VALUES = list(WORK_FIELDS.values())
+
+    # Position of the Type value within the WORK_FIELDS value order,
+    # so its first-value-only rule can apply once per record instead of
+    # a label comparison inside the per-field loop
+    _TYPE_VALUE_INDEX = list(WORK_FIELDS).index('Type')
+
+    # Positional row type fed straight to csv.writer: no dict per row
+    # and none of DictWriter's per-write fieldname reordering
+    Record = namedtuple(
+        'Record',
+        [name.lower().replace(' ', '_') for name in CSV_FIELDNAMES],
+    )
+
+    # Handles per batched metadata query (bounds the IN (...) list)
+    METADATA_CHUNK_SIZE = 500
+
+    # CSV write-behind: flush after this many rows or this many seconds,
+    # whichever comes first, instead of syscall-per-row
+    CSV_FLUSH_EVERY_ROWS = 1000
+    CSV_FLUSH_INTERVAL = 5.0  # seconds
+
+    # Buffer size for the CSV file object (lets stdio batch the writes)
+    CSV_BUFFER_SIZE = 1 << 20  # 1 MiB
+
     def __init__(
         self,
         db: DatabaseConnection,
@@ -63,6 +100,11 @@ class BatchExporter:
         self.dspace = dspace_client
         self.export_dir = export_dir or Config.LIBSAFE_EXPORT_DIRECTORY
 
+        # Resolved once here: validate_safe_path resolves its allowed
+        # directory on every call, and handing it the canonical path
+        # keeps that resolution from chasing symlinks per record
+        self._resolved_export_dir = self.export_dir.resolve()
+
         # Statistics
         self.stats = {
             'total': 0,
@@ -71,6 +113,20 @@ class BatchExporter:
             'errors': 0,
         }
 
+        # Locks for shared resources when downloads run concurrently:
+        # CSV writes must stay one-row-at-a-time, and the PyMySQL
+        # connection is not thread-safe
+        self._csv_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+        # Metadata and bitstream UUIDs prefetched in bulk per chunk
+        self._metadata_cache: Dict[str, Dict[str, list]] = {}
+        self._uuid_cache: Dict[str, list] = {}
+
+        # CSV write-behind state (guarded by _csv_lock)
+        self._rows_since_flush = 0
+        self._last_csv_flush = 0.0
+
         # Timing
         self.start_time = None
 
@@ -84,22 +140,94 @@ class BatchExporter:
         Returns:
             Set of handle suffixes already in CSV
         """
-        existing = set()
+        existing: Set[str] = set()
+
+        if not csv_path.exists():
+            return existing
+
+        # Single mmap pass instead of csv.DictReader: no dict per row,
+        # no per-field parsing. The Handle column is a handle URL, so it
+        # never contains commas or quoting - a raw byte scan up to the
+        # first comma is safe. The header is checked rather than trusted:
+        # if Handle ever moves off column 0 the scan falls back to a
+        # real CSV parse.
+        try:
+            with open(csv_path, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty file (nothing exported yet)
+                    return existing
+
+                with mm:
+                    size = len(mm)
+                    start = 0
+                    header = True
+
+                    while start < size:
+                        end = mm.find(b'\n', start)
+                        if end == -1:
+                            end = size
+
+                        line = mm[start:end]
+                        start = end + 1
+
+                        if header:
+                            header = False
+                            if line.split(b',')[0].strip() != b'Handle':
+                                logger.warning(
+                                    "Handle is not the first CSV column; "
+                                    "falling back to csv.reader for resume scan"
+                                )
+                                return self._scan_csv_handles_slow(csv_path)
+                            continue
+
+                        comma = line.find(b',')
+                        handle_field = line[:comma] if comma != -1 else line
 
-        if csv_path.exists():
-            try:
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
                         # Extract handle suffix from full handle URL
-                        handle_url = row.get('Handle', '')
-                        if '/' in handle_url:
-                            handle_suffix = handle_url.split('/')[-1]
-                            existing.add(handle_suffix)
+                        # (rpartition is one C-level scan, no list)
+                        _, sep, suffix = handle_field.rpartition(b'/')
+                        if sep:
+                            suffix = suffix.strip()
+                            if suffix:
+                                existing.add(suffix.decode('utf-8', 'replace'))
+
+            logger.info(f"Found {len(existing)} existing records in CSV")
+        except Exception as e:
+            logger.warning(f"Could not read existing CSV: {e}")
+
+        return existing
 
-                logger.info(f"Found {len(existing)} existing records in CSV")
-            except Exception as e:
-                logger.warning(f"Could not read existing CSV: {e}")
+    def _scan_csv_handles_slow(self, csv_path: Path) -> Set[str]:
+        """
+        Resume scan via csv.reader, for CSVs whose Handle column moved
+
+        Args:
+            csv_path: Path to CSV file
+
+        Returns:
+            Set of handle suffixes already in CSV
+        """
+        existing: Set[str] = set()
+
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header or 'Handle' not in header:
+                    return existing
+                handle_idx = header.index('Handle')
+
+                for row in reader:
+                    if len(row) > handle_idx:
+                        suffix = row[handle_idx].rpartition('/')[2].strip()
+                        if suffix:
+                            existing.add(suffix)
+
+            logger.info(f"Found {len(existing)} existing records in CSV")
+        except Exception as e:
+            logger.warning(f"Could not read existing CSV: {e}")
 
         return existing
 
@@ -113,11 +241,16 @@ class BatchExporter:
         existing_suffixes = set()
 
         try:
-            for file_path in self.export_dir.iterdir():
-                if file_path.is_file() and file_path.suffix == '.pdf':
-                    # Extract handle suffix from filename (remove .pdf)
-                    handle_suffix = file_path.stem
-                    existing_suffixes.add(handle_suffix)
+            # os.scandir gets the file type from the directory entry
+            # itself, so a directory of 100k PDFs is one getdents64 loop
+            # instead of a stat call per file (follow_symlinks=False
+            # keeps it that way; symlinks are not expected here)
+            with os.scandir(self.export_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith('.pdf')
+                            and entry.is_file(follow_symlinks=False)):
+                        # Extract handle suffix from filename (remove .pdf)
+                        existing_suffixes.add(entry.name[:-4])
 
             logger.info(f"Found {len(existing_suffixes)} existing PDF files")
         except Exception as e:
@@ -125,7 +258,7 @@ class BatchExporter:
 
         return existing_suffixes
 
-    def _get_metadata_for_handle(self, handle: str) -> Dict[str, str]:
+    def _get_metadata_for_handle(self, handle: str) -> "BatchExporter.Record":
         """
         Get metadata values for a handle
 
@@ -133,29 +266,31 @@ class BatchExporter:
             handle: DSpace handle
 
         Returns:
-            Dictionary of metadata field values
+            Record of metadata values in CSV column order (File empty)
         """
-        metadata = {
-            'Handle': f'http://hdl.handle.net/{handle}',
-            'File': '',
-        }
-
-        for label, field in self.WORK_FIELDS.items():
-            values = self.db.get_metadata_values(handle, field)
-
-            # Join multiple values with semicolon
-            combined = '; '.join(values)
-
-            # Clean up whitespace
-            combined = re.sub(r'\s+', ' ', combined).strip()
-
-            # For Type field, take only the first value if multiple
-            if label == 'Type' and '; ' in combined:
-                combined = combined.split('; ')[0]
-
-            metadata[label] = combined
-
-        return metadata
+        prefetched = self._metadata_cache.get(handle)
+        if prefetched is None:
+            # Fallback for handles missed by the bulk prefetch: one
+            # combined query rather than one round-trip per field. The
+            # lock lives here, on the miss path itself, so a cache
+            # entry pruned between a caller's membership check and this
+            # lookup can never reach the connection unlocked
+            with self._db_lock:
+                prefetched = self.db.get_all_metadata(handle, self.WORK_FIELD_VALUES)
+
+        # Join multiple values with semicolon and clean up whitespace;
+        # no per-field branching inside the loop
+        values_out = [
+            _WHITESPACE_RE.sub(' ', '; '.join(prefetched.get(field, []))).strip()
+            for field in self.WORK_FIELD_VALUES
+        ]
+
+        # For Type field, take only the first value if multiple
+        type_value = values_out[self._TYPE_VALUE_INDEX]
+        if '; ' in type_value:
+            values_out[self._TYPE_VALUE_INDEX] = type_value.split('; ', 1)[0]
+
+        return self.Record(f'http://hdl.handle.net/{handle}', '', *values_out)
 
     def _download_file(
         self,
@@ -175,25 +310,19 @@ class BatchExporter:
         try:
             logger.debug(f"Downloading bitstream {uuid}")
 
-            response = self.dspace.get_bitstream_content(uuid)
+            # The client streams the body and places the file
+            # atomically: file_path only ever appears fully written
+            self.dspace.get_bitstream_to_file(
+                uuid,
+                file_path,
+                max_size=Config.MAX_FILE_SIZE,
+            )
 
-            if response['status'] == 'success':
-                # Validate file size
-                content = response['body']
-                if len(content) > Config.MAX_FILE_SIZE:
-                    logger.warning(f"File exceeds size limit: {len(content)} bytes")
-                    return False
-
-                # Write file atomically using temporary file
-                temp_path = file_path.with_suffix('.tmp')
-                temp_path.write_bytes(content)
-
-                # Move to final location
-                temp_path.rename(file_path)
-
-                logger.info(f"Downloaded file: {file_path.name}")
-                return True
+            logger.info(f"Downloaded file: {file_path.name}")
+            return True
 
+        except FileSizeLimitError as e:
+            logger.warning(f"File exceeds size limit for {uuid}: {e}")
         except DSpaceAPIError as e:
             logger.error(f"DSpace API error for {uuid}: {e}")
         except Exception as e:
@@ -201,6 +330,124 @@ class BatchExporter:
 
         return False
 
+    def _write_csv_row(
+        self,
+        writer: Any,
+        csv_file: TextIO,
+        metadata: "BatchExporter.Record",
+    ):
+        """
+        Write one CSV row with batched flushing
+
+        Rows accumulate in the file buffer and are flushed (and fsynced,
+        since the CSV doubles as the resume journal) every
+        CSV_FLUSH_EVERY_ROWS rows or CSV_FLUSH_INTERVAL seconds,
+        whichever comes first; crash recovery still works because a
+        resumed run re-checks the CSV for already-exported handles.
+
+        Args:
+            writer: Shared CSV writer
+            csv_file: Open CSV file object
+            metadata: Row to write
+        """
+        with self._csv_lock:
+            writer.writerow(metadata)
+            self._rows_since_flush += 1
+
+            now = time.monotonic()
+            if (self._rows_since_flush >= self.CSV_FLUSH_EVERY_ROWS
+                    or now - self._last_csv_flush >= self.CSV_FLUSH_INTERVAL):
+                csv_file.flush()
+                os.fsync(csv_file.fileno())
+                self._rows_since_flush = 0
+                self._last_csv_flush = now
+
+    def _process_handle(
+        self,
+        handle: str,
+        handle_suffix: str,
+        writer: Any,
+        csv_file: TextIO,
+        file_exists: bool,
+    ) -> str:
+        """
+        Process a single handle: fetch metadata, download PDF, write CSV row
+
+        Runs on a worker thread; CSV and database access are serialized
+        via locks while downloads proceed concurrently. Handles already
+        recorded in the CSV are filtered out before submission, so every
+        handle reaching this method represents real work.
+
+        Args:
+            handle: DSpace handle to process
+            handle_suffix: Suffix part of the handle (computed once at
+                chunk-build time, so it is not re-scanned here)
+            writer: Shared CSV writer
+            csv_file: Open CSV file object (for flushing)
+            file_exists: Whether the PDF is already on disk (resolved
+                at chunk-build time alongside the CSV check)
+
+        Returns:
+            Status string: 'success', 'skipped', or 'error'
+        """
+        # Validate handle
+        try:
+            validate_handle(handle)
+        except Exception as e:
+            logger.warning(f"Invalid handle {handle}: {e}")
+            return 'error'
+
+        # Get metadata; the database fallback inside locks the
+        # connection itself on a cache miss
+        metadata = self._get_metadata_for_handle(handle)
+
+        # Sanitize filename
+        filename = sanitize_filename(f"{handle_suffix}.pdf")
+        metadata = metadata._replace(file=filename)
+
+        file_path = self._resolved_export_dir / filename
+
+        # Validate file path is safe
+        try:
+            validate_safe_path(file_path, self._resolved_export_dir)
+        except Exception as e:
+            logger.error(f"Path validation failed for {filename}: {e}")
+            return 'error'
+
+        # Check if file already exists
+        if file_exists:
+            # File exists, just add to CSV
+            self._write_csv_row(writer, csv_file, metadata)
+            logger.info(f"Added existing file to CSV: {handle}")
+            return 'success'
+
+        # Download file; UUIDs are prefetched per chunk, with a
+        # per-handle query only as fallback
+        uuids = self._uuid_cache.get(handle)
+        if uuids is None:
+            with self._db_lock:
+                uuids = self.db.get_bitstream_uuids(handle)
+
+        if not uuids:
+            logger.warning(f"No PDF bitstreams found for {handle}")
+            return 'error'
+
+        # Try to download the first PDF
+        for uuid in uuids:
+            logger.info(f"Processing {handle} - UUID: {uuid}")
+
+            if self._download_file(uuid, file_path):
+                # SUCCESS: Write to CSV right after successful download
+                self._write_csv_row(writer, csv_file, metadata)
+                logger.info(f"✓ Added {handle} to CSV")
+
+                # Only download the first successful file
+                return 'success'
+
+        # No files were successfully downloaded
+        logger.warning(f"Failed to download any files for {handle}")
+        return 'error'
+
     def export_batch(
         self,
         start_date: Optional[str] = None,
@@ -247,111 +494,169 @@ class BatchExporter:
         # Track downloaded files for limit
         downloaded_count = 0
 
-        # Get handles to export
+        # Get handles to export as a stream: the handle query result is
+        # not buffered into memory, so processing starts on the first
+        # handle before the full result set has arrived. Embargo
+        # filtering happens inside the query itself, so embargoed
+        # records never leave the database.
         logger.info("Fetching handles from database...")
-        all_handles = self.db.get_handles_for_export(start_date, end_date)
-        logger.info(f"Found {len(all_handles)} total handles")
+        handles_iter = self.db.get_handles_for_export(start_date, end_date, today)
         if limit > 0:
             logger.info(f"Download limit: {limit} files")
 
-        # Filter out embargoed handles
-        embargoed = self.db.get_embargoed_handles(today)
-        handles = [h for h in all_handles if h not in embargoed]
-        logger.info(f"Unembargoed handles: {len(handles)}")
+        work_fields = self.WORK_FIELD_VALUES
+        total_handles = 0
 
-        # Open CSV file for incremental writing
+        # Open CSV file for incremental writing with a large buffer so
+        # stdio aggregates the batched rows between flushes
         csv_mode = 'a' if csv_path.exists() else 'w'
-        csv_file = open(csv_path, csv_mode, newline='', encoding='utf-8')
-        writer = csv.DictWriter(csv_file, fieldnames=self.CSV_FIELDNAMES)
+        csv_file = open(
+            csv_path, csv_mode,
+            newline='', encoding='utf-8',
+            buffering=self.CSV_BUFFER_SIZE,
+        )
+        writer = csv.writer(csv_file)
+        self._rows_since_flush = 0
+        self._last_csv_flush = time.monotonic()
 
         # Write header only for new files
         if csv_mode == 'w':
-            writer.writeheader()
+            writer.writerow(self.CSV_FIELDNAMES)
             csv_file.flush()
 
-        try:
-            # Process each handle with progress bar
-            for handle in tqdm(handles, desc="Exporting", unit="record"):
-                # Check if limit reached
-                if limit > 0 and downloaded_count >= limit:
-                    logger.info(f"Download limit of {limit} files reached. Stopping export.")
-                    break
-
-                self.stats['total'] += 1
-
-                # Validate handle
-                try:
-                    validate_handle(handle)
-                except Exception as e:
-                    logger.warning(f"Invalid handle {handle}: {e}")
-                    self.stats['errors'] += 1
-                    continue
-
-                # Extract handle suffix
-                handle_suffix = handle.split('/')[1]
-
-                # Skip if already in CSV
-                if handle_suffix in existing_in_csv:
-                    logger.debug(f"Skipping {handle} (already in CSV)")
-                    self.stats['skipped'] += 1
+        # Process handles with a pool of concurrent downloads; the export
+        # is network-latency bound, so overlapping requests amortizes the
+        # HTTP round-trips (the GIL is released during socket I/O)
+        executor = ThreadPoolExecutor(
+            max_workers=Config.DOWNLOAD_CONCURRENCY,
+            thread_name_prefix='download',
+        )
+        # Redraw at most twice a second: on skip-heavy resumed runs
+        # updates arrive at microsecond intervals and unthrottled
+        # terminal writes would dominate; low smoothing keeps the rate
+        # estimate stable across the skip bursts
+        progress = tqdm(
+            desc="Exporting", unit="record",
+            mininterval=0.5, smoothing=0.05,
+        )
+        limit_reached = False
+
+        def next_chunk():
+            """
+            Pull, prefilter, and metadata-prefetch the next handle chunk
+
+            Returns the list of handles still needing work, or None when
+            the stream is exhausted. Prefetched metadata is merged into
+            the shared cache before the chunk's futures are submitted.
+            """
+            nonlocal total_handles
+
+            while True:
+                chunk = list(islice(handles_iter, self.METADATA_CHUNK_SIZE))
+                if not chunk:
+                    return None
+
+                total_handles += len(chunk)
+
+                # Drop already-exported handles before any validation or
+                # metadata work: on a resumed run most of the stream is
+                # skips, and this keeps them out of the pool entirely.
+                # The suffix is computed and hashed exactly once here -
+                # both membership tests resolve at chunk-build time and
+                # their results are carried alongside the handle, so
+                # workers never touch the sets.
+                fresh = []
+                for handle in chunk:
+                    suffix = handle.partition('/')[2]
+                    if suffix in existing_in_csv:
+                        self.stats['total'] += 1
+                        self.stats['skipped'] += 1
+                        progress.update(1)
+                    else:
+                        fresh.append((handle, suffix, suffix in existing_files))
+                if not fresh:
                     continue
 
-                # Get metadata
-                metadata = self._get_metadata_for_handle(handle)
-
-                # Sanitize filename
-                filename = sanitize_filename(f"{handle_suffix}.pdf")
-                metadata['File'] = filename
-
-                file_path = self.export_dir / filename
-
-                # Validate file path is safe
-                try:
-                    validate_safe_path(file_path, self.export_dir)
-                except Exception as e:
-                    logger.error(f"Path validation failed for {filename}: {e}")
-                    self.stats['errors'] += 1
-                    continue
-
-                # Check if file already exists
-                if handle_suffix in existing_files:
-                    # File exists, just add to CSV
-                    writer.writerow(metadata)
-                    csv_file.flush()
-                    logger.info(f"Added existing file to CSV: {handle}")
-                    self.stats['success'] += 1
-                    downloaded_count += 1
-                    continue
-
-                # Download file
-                uuids = self.db.get_bitstream_uuids(handle)
-
-                if not uuids:
-                    logger.warning(f"No PDF bitstreams found for {handle}")
-                    self.stats['errors'] += 1
-                    continue
-
-                # Try to download the first PDF
-                for uuid in uuids:
-                    logger.info(f"Processing {handle} - UUID: {uuid}")
-
-                    if self._download_file(uuid, file_path):
-                        # SUCCESS: Write to CSV immediately after successful download
-                        writer.writerow(metadata)
-                        csv_file.flush()  # Force write to disk
+                # Prefetch metadata and bitstream UUIDs in bulk: two
+                # queries per chunk instead of one query per field per
+                # handle in the hot loop (the connection lock serializes
+                # this with worker lookups)
+                fresh_handles = [handle for handle, _, _ in fresh]
+                with self._db_lock:
+                    prefetched = self.db.get_metadata_bulk(fresh_handles, work_fields)
+                    uuid_map = self.db.get_bitstream_uuids_bulk(fresh_handles)
+                self._metadata_cache.update(prefetched)
+                self._uuid_cache.update(uuid_map)
+                # Handles with no matching rows still count as prefetched
+                for handle in fresh_handles:
+                    self._metadata_cache.setdefault(handle, {})
+                    self._uuid_cache.setdefault(handle, [])
+
+                return fresh
 
+        try:
+            # Software pipeline over the chunked stream: while one
+            # chunk's downloads are in flight, the main thread pulls and
+            # metadata-prefetches the next chunk, so database latency
+            # hides behind HTTP latency instead of adding to it
+            pending_chunk = next_chunk()
+            while not limit_reached and pending_chunk is not None:
+                chunk = pending_chunk
+
+                futures = {
+                    executor.submit(
+                        self._process_handle,
+                        handle,
+                        suffix,
+                        writer,
+                        csv_file,
+                        file_exists,
+                    ): handle
+                    for handle, suffix, file_exists in chunk
+                }
+
+                # Overlap: prepare the next chunk while workers download
+                pending_chunk = next_chunk()
+
+                for future in as_completed(futures):
+                    handle = futures[future]
+
+                    try:
+                        status = future.result()
+                    except Exception as e:
+                        logger.error(f"Unexpected error processing {handle}: {e}")
+                        status = 'error'
+
+                    self.stats['total'] += 1
+                    if status == 'success':
                         self.stats['success'] += 1
                         downloaded_count += 1
-                        logger.info(f"✓ Added {handle} to CSV")
+                    elif status == 'skipped':
+                        self.stats['skipped'] += 1
+                    else:
+                        self.stats['errors'] += 1
+
+                    progress.update(1)
 
-                        # Only download the first successful file
+                    # Check if limit reached; cancel work not yet started
+                    if limit > 0 and downloaded_count >= limit:
+                        logger.info(f"Download limit of {limit} files reached. Stopping export.")
+                        limit_reached = True
                         break
-                else:
-                    # No files were successfully downloaded
-                    logger.warning(f"Failed to download any files for {handle}")
-                    self.stats['errors'] += 1
+
+                # Drop the drained chunk's prefetched data so the caches
+                # hold at most two chunks (current + prefetched) at a time
+                for handle, _, _ in chunk:
+                    self._metadata_cache.pop(handle, None)
+                    self._uuid_cache.pop(handle, None)
 
         finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            progress.close()
+            # Final flush+fsync of any buffered rows (close alone would
+            # flush but not force them to disk), then close
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
             csv_file.close()
             logger.info("CSV file closed")
 
@@ -360,7 +665,7 @@ class BatchExporter:
 
         # Prepare summary
         summary = {
-            'total_handles': len(handles),
+            'total_handles': total_handles,
             'processed': self.stats['total'],
             'successful': self.stats['success'],
             'skipped': self.stats['skipped'],